@@ -17,22 +17,146 @@ License: MIT
 """
 
 import asyncio
+import contextlib
+import importlib.util
+import io
+import multiprocessing
 import os
 import json
-import subprocess
 import sys
 import re
+import stat
+import string
+import tempfile
+import threading
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from types import ModuleType
+from typing import Any, Optional, Union
 
 import yaml
 from mcp.server.fastmcp import FastMCP
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Configuration
 SKILLS_DIR = os.environ.get("SKILLS_DIR", os.path.join(os.path.dirname(__file__), "..", "skills"))
 Path(SKILLS_DIR).mkdir(parents=True, exist_ok=True)
 
+# Run skill scripts inside the server process instead of spawning a new
+# interpreter per call. This removes subprocess isolation (scripts share the
+# server's cwd, memory and globals), so only enable it for trusted skills.
+INPROCESS_EXECUTION = os.environ.get("SKILLS_INPROCESS") == "1"
+SCRIPT_TIMEOUT = 60
+
+# Cap on captured stdout/stderr per script run; runaway output kills the script
+MAX_SCRIPT_OUTPUT_BYTES = 10 * 1024 * 1024
+
+# Command-line argument for scripts called without parameters
+_EMPTY_PARAMS_JSON = "{}"
+
+# Number of warm worker processes for script execution. Each worker imports a
+# script once and calls run(params) on every request, which skips interpreter
+# startup while still keeping scripts out of the server process.
+# 0 (the default) spawns a fresh subprocess per call.
+SCRIPT_WORKERS = int(os.environ.get("SKILLS_WORKERS", "0"))
+
+# Maximum number of scripts running at the same time; further calls wait
+MAX_CONCURRENT_SCRIPTS = int(os.environ.get("SKILLS_MAX_CONCURRENT_SCRIPTS", "8"))
+
+# Parsed SKILL.md files: path -> (mtime_ns, size, frontmatter, body, complete).
+# body is None when only the frontmatter has been read (skill listing), and
+# complete is False when that frontmatter is partial or not plain YAML.
+# Kept in least-recently-used order and bounded for long sessions.
+_FrontmatterEntry = tuple[int, int, dict, Optional[str], bool]
+_frontmatter_cache: OrderedDict[str, _FrontmatterEntry] = OrderedDict()
+_frontmatter_cache_lock = threading.Lock()
+_FRONTMATTER_CACHE_SIZE = 256
+
+# Listing reads only the head of SKILL.md; the larger size is a retry for
+# frontmatter that doesn't close within the first read
+_FRONTMATTER_HEAD_SIZE = 4096
+_FRONTMATTER_MAX_SIZE = 65536
+
+# Resource files up to this size are read with a single pread
+_PREAD_MAX_SIZE = 4 * 1024 * 1024
+
+# Last full skill listing as (manifest, skills). The manifest maps each
+# SKILL.md path to [mtime_ns, size]; while it matches the files on disk the
+# listing is reused. It is also persisted in SKILLS_DIR so a restarted server
+# can skip parsing when nothing changed.
+_skills_snapshot: Optional[tuple[dict, list[dict]]] = None
+SKILLS_SNAPSHOT_FILE = ".skills_snapshot.json"
+# Bump whenever the listing's parsing changes so stale snapshots are dropped
+SKILLS_SNAPSHOT_VERSION = 3
+
+# Resource listings: skill path -> (skill dir mtime, (subdir, mtime) pairs, resources)
+_resources_cache: dict[str, tuple[int, tuple, dict]] = {}
+_RESOURCE_DIRS = ("scripts", "references", "assets")
+
+# Loaded script modules, keyed by path and invalidated by mtime
+_MODULE_CACHE: dict[str, tuple[int, ModuleType]] = {}
+# Scripts are imported as submodules of a synthetic per-skill package
+_SKILLS_PACKAGE = "_skills"
+_SCRIPT_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_SCRIPTS)
+_INPROCESS_POOL = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_SCRIPTS,
+    thread_name_prefix="skill-script"
+)
+_WORKER_POOL: Optional[ProcessPoolExecutor] = None
+_SKILLS_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="skill-io")
+
+# Skill names per the Agent Skills spec: lowercase alphanumeric and hyphens
+_SKILL_NAME_RE = re.compile(r'[a-z0-9](?:-?[a-z0-9])*')
+
+# A "key: value" line in SKILL.md frontmatter, for the fast listing path
+# that avoids a YAML parse: (indent, key, value or None)
+_FRONTMATTER_LINE_RE = re.compile(r'( *)([A-Za-z_][A-Za-z0-9_.-]*):(?: +(.*?))? *')
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"\\]*)"')
+_SINGLE_QUOTED_RE = re.compile(r"'([^']*)'")
+# Plain words YAML resolves to booleans or null rather than strings
+_YAML_NON_STR_WORDS = frozenset(
+    "yes Yes YES no No NO true True TRUE false False FALSE "
+    "on On ON off Off OFF null Null NULL".split()
+)
+# Characters that give a plain value special meaning when they start it
+_YAML_VALUE_INDICATORS = frozenset("-?:,[]{}#&*!|>%@`=<")
+
+# Top-level directories that get_skill_resource may read from
+_ALLOWED_RESOURCE_PREFIXES = ("references/", "assets/", "scripts/")
+
+# Resource paths: an allowed top-level directory followed by one or more
+# path segments, with no "..", backslashes or control characters anywhere
+_RESOURCE_PATH_RE = re.compile(
+    r'(?:references|assets|scripts)/(?!.*\.\.)[^/\\\x00-\x1f]+(?:/[^/\\\x00-\x1f]+)*'
+)
+
+# Characters that may appear in a skill directory name, and a table that
+# deletes every other ASCII character (non-ASCII is dropped before lookup)
+_SAFE_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "_-")
+_SAFE_NAME_TABLE = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if c not in _SAFE_NAME_CHARS
+))
+
+
+def _load_frontmatter_yaml(yaml_text: str) -> Optional[dict]:
+    """Parse the text between the --- markers, or return None if it isn't valid YAML."""
+    # Skip the loader entirely for an empty --- --- block
+    if not yaml_text.strip():
+        return {}
+    try:
+        return yaml.load(yaml_text, Loader=_YamlLoader) or {}
+    except yaml.YAMLError:
+        return None
+
 
 def parse_skill_frontmatter(content: str) -> tuple[dict, str]:
     """
@@ -47,24 +171,271 @@ def parse_skill_frontmatter(content: str) -> tuple[dict, str]:
     frontmatter = {}
     body = content
     
-    # Check for YAML frontmatter (content between --- markers)
+    # Check for YAML frontmatter (content between --- markers). Locate the
+    # closing marker and slice, rather than splitting the whole file.
     if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            try:
-                frontmatter = yaml.safe_load(parts[1]) or {}
-                body = parts[2].strip()
-            except yaml.YAMLError:
-                pass
+        end = content.find("\n---", 3)
+        if end != -1:
+            parsed = _load_frontmatter_yaml(content[3:end])
+            if parsed is not None:
+                frontmatter = parsed
+                body = content[end + 4:].strip()
+    
+    return frontmatter, body
+
+
+def _parse_lite_scalar(raw: str) -> Optional[str]:
+    """Return the string value of a one-line YAML scalar, or None if it needs real YAML."""
+    if raw.startswith('"'):
+        match = _DOUBLE_QUOTED_RE.fullmatch(raw)
+        return match.group(1) if match else None
+    
+    if raw.startswith("'"):
+        match = _SINGLE_QUOTED_RE.fullmatch(raw)
+        return match.group(1) if match else None
+    
+    # Plain scalars starting with a letter can't be numbers or timestamps;
+    # anything that might be a comment, mapping or special word goes to YAML
+    if (not raw or not raw[0].isascii() or not raw[0].isalpha()
+            or ": " in raw or " #" in raw or raw.endswith(":")
+            or raw in _YAML_NON_STR_WORDS):
+        return None
+    return raw
+
+
+def _is_simple_yaml_value(raw: str) -> bool:
+    """Whether a one-line value is one YAML reads as a plain scalar without error."""
+    if not raw:
+        return True
+    if raw[0] in "\"'":
+        return _parse_lite_scalar(raw) is not None
+    # Leading digits with a dash may be a timestamp, which YAML can reject
+    if raw[0] in _YAML_VALUE_INDICATORS or (raw[0].isdigit() and "-" in raw):
+        return False
+    return ": " not in raw and " #" not in raw and not raw.endswith(":")
+
+
+def parse_skill_frontmatter_lite(content: str) -> Optional[dict]:
+    """
+    Extract name and description from SKILL.md frontmatter without YAML.
+    
+    Every line must be a simple "key: value" line, optionally one level of
+    "key: value" lines nested under a key with no value. Anything else
+    (multi-line values, flow collections, escapes, comments after values,
+    non-string name/description) returns None so the caller can fall back
+    to parse_skill_frontmatter.
+    
+    Args:
+        content: SKILL.md content, or at least its frontmatter block
+    
+    Returns:
+        Dict with the name/description keys that are present, or None
+    """
+    if not content.startswith("---"):
+        return None
+    end = content.find("\n---", 3)
+    if end == -1:
+        return None
+    
+    fields = {}
+    # Indent of the lines nested under the last top-level key: None when that
+    # key had a value, "" until its first nested line is seen
+    nested_indent = None
+    for line in content[3:end].split("\n"):
+        line = line.rstrip("\r")
+        stripped = line.lstrip(" ")
+        if not stripped or stripped.startswith("#"):
+            continue
+        # Tabs, BOMs and other characters YAML treats specially
+        if not line.isprintable():
+            return None
+        match = _FRONTMATTER_LINE_RE.fullmatch(line)
+        if match is None:
+            return None
+        indent, key, raw = match.groups()
+        raw = raw or ""
+        
+        if indent:
+            if nested_indent is None or nested_indent not in ("", indent):
+                return None
+            nested_indent = indent
+            if not _is_simple_yaml_value(raw):
+                return None
+            continue
+        
+        nested_indent = None if raw else ""
+        if key in ("name", "description"):
+            value = _parse_lite_scalar(raw)
+            if value is None or key in fields:
+                return None
+            fields[key] = value
+        elif not _is_simple_yaml_value(raw):
+            return None
+    
+    return fields
+
+
+def _frontmatter_cache_get(key: str) -> Optional[_FrontmatterEntry]:
+    """Look up a cached SKILL.md parse, marking it as recently used."""
+    with _frontmatter_cache_lock:
+        cached = _frontmatter_cache.get(key)
+        if cached is not None:
+            _frontmatter_cache.move_to_end(key)
+        return cached
+
+
+def _frontmatter_cache_put(key: str, entry: _FrontmatterEntry) -> None:
+    """Store a SKILL.md parse, evicting the least recently used one if full."""
+    with _frontmatter_cache_lock:
+        _frontmatter_cache[key] = entry
+        _frontmatter_cache.move_to_end(key)
+        if len(_frontmatter_cache) > _FRONTMATTER_CACHE_SIZE:
+            _frontmatter_cache.popitem(last=False)
+
+
+def load_skill_md(skill_md: Path) -> tuple[dict, str]:
+    """
+    Read and parse a SKILL.md file, reusing the last parse until it changes.
+    
+    Args:
+        skill_md: Path to the SKILL.md file
     
+    Returns:
+        Tuple of (frontmatter_dict, body_content)
+    """
+    key = str(skill_md)
+    st = skill_md.stat()
+    
+    cached = _frontmatter_cache_get(key)
+    fresh = cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size
+    if fresh and cached[3] is not None:
+        return cached[2], cached[3]
+    
+    content = skill_md.read_text()
+    if fresh and cached[4]:
+        # The listing already parsed the full frontmatter; only the body is missing
+        frontmatter = cached[2]
+        body = content[content.find("\n---", 3) + 4:].strip()
+    else:
+        frontmatter, body = parse_skill_frontmatter(content)
+    
+    _frontmatter_cache_put(key, (st.st_mtime_ns, st.st_size, frontmatter, body, True))
     return frontmatter, body
 
 
+def _read_head(path: Union[str, Path], n: int = _FRONTMATTER_HEAD_SIZE) -> bytes:
+    """Read up to n bytes from the start of a file with a single pread."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.pread(fd, n, 0)
+    finally:
+        os.close(fd)
+
+
+def _read_bytes(path: Union[str, Path]) -> Optional[bytes]:
+    """
+    Read a whole file, with a single pread when it is small.
+    
+    Args:
+        path: Path to the file
+    
+    Returns:
+        The file's bytes, or None if it is not a regular file
+    """
+    # O_NONBLOCK keeps the open from hanging on a FIFO; it doesn't affect
+    # reads from regular files
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        if st.st_size <= _PREAD_MAX_SIZE:
+            return os.pread(fd, st.st_size, 0)
+        # Large files go through a buffered read of the same descriptor,
+        # which loops until EOF instead of relying on one syscall
+        with open(fd, "rb", closefd=False) as f:
+            return f.read()
+    finally:
+        os.close(fd)
+
+
+def read_frontmatter_only(skill_md: Union[str, Path]) -> tuple[dict, bool]:
+    """
+    Parse the frontmatter of a SKILL.md file without reading its body.
+    
+    When name and description are simple values they are extracted without
+    a YAML parse, and the result holds only those keys.
+    
+    Args:
+        skill_md: Path to the SKILL.md file
+    
+    Returns:
+        Tuple of (frontmatter_dict, complete). The dict is empty if the file
+        has none; complete is True only when it is the full YAML parse of a
+        closed --- block, so the body is everything after the closing marker.
+    """
+    head = _read_head(skill_md)
+    if not head.startswith(b"---"):
+        return {}, False
+    
+    end = head.find(b"\n---", 3)
+    if end == -1 and len(head) == _FRONTMATTER_HEAD_SIZE:
+        head = _read_head(skill_md, _FRONTMATTER_MAX_SIZE)
+        end = head.find(b"\n---", 3)
+    
+    if end == -1:
+        if len(head) < _FRONTMATTER_MAX_SIZE:
+            # No closing marker anywhere in the file
+            return {}, False
+        # Unusually large frontmatter; fall back to parsing the whole file
+        return parse_skill_frontmatter(Path(skill_md).read_text())[0], False
+    
+    text = head[:end + 4].decode("utf-8")
+    
+    # Listing only needs name and description; skip YAML when they are simple
+    fields = parse_skill_frontmatter_lite(text)
+    if fields is not None:
+        return fields, False
+    
+    frontmatter = _load_frontmatter_yaml(text[3:-4])
+    if frontmatter is None:
+        return {}, False
+    return frontmatter, True
+
+
+def load_skill_frontmatter(skill_md: Union[str, Path]) -> dict:
+    """
+    Get the frontmatter of a SKILL.md file, reusing any cached parse.
+    
+    Args:
+        skill_md: Path to the SKILL.md file
+    
+    Returns:
+        The frontmatter dict
+    """
+    key = str(skill_md)
+    st = os.stat(skill_md)
+    
+    cached = _frontmatter_cache_get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    frontmatter, complete = read_frontmatter_only(skill_md)
+    _frontmatter_cache_put(key, (st.st_mtime_ns, st.st_size, frontmatter, None, complete))
+    return frontmatter
+
+
+def safe_skill_name(name: str) -> str:
+    """Reduce a name to lowercase ASCII letters, digits, underscores and hyphens."""
+    # str.translate leaves unmapped code points alone, so anything outside
+    # ASCII is stripped by the encode first
+    return name.lower().encode("ascii", "ignore").decode("ascii").translate(_SAFE_NAME_TABLE)
+
+
 def get_skill_path(name: str) -> Path:
     """Get the full path for a skill directory."""
     # Sanitize the name to prevent directory traversal
-    safe_name = "".join(c for c in name if c.isalnum() or c in "_-").lower()
-    return Path(SKILLS_DIR) / safe_name
+    return Path(SKILLS_DIR) / safe_skill_name(name)
 
 
 def validate_skill_name(name: str) -> tuple[bool, str]:
@@ -77,19 +448,21 @@ def validate_skill_name(name: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    # One regex walk covers the charset, edge hyphens and consecutive hyphens;
+    # the individual checks below only pick the error message
+    if len(name) <= 64 and _SKILL_NAME_RE.fullmatch(name):
+        return True, ""
+    
     if not name:
         return False, "Name cannot be empty"
     
     if len(name) > 64:
         return False, "Name must be 64 characters or less"
     
-    if not re.match(r'^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$', name):
-        return False, "Name must be lowercase alphanumeric with hyphens, cannot start/end with hyphen"
-    
     if '--' in name:
         return False, "Name cannot contain consecutive hyphens"
     
-    return True, ""
+    return False, "Name must be lowercase alphanumeric with hyphens, cannot start/end with hyphen"
 
 
 def list_skill_resources(skill_path: Path) -> dict:
@@ -102,27 +475,472 @@ def list_skill_resources(skill_path: Path) -> dict:
     Returns:
         Dict with scripts, references, and assets lists
     """
-    resources = {
-        "scripts": [],
-        "references": [],
-        "assets": []
-    }
+    key = str(skill_path)
+    try:
+        skill_mtime = os.stat(key).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return {name: [] for name in _RESOURCE_DIRS}
     
-    scripts_dir = skill_path / "scripts"
-    if scripts_dir.exists():
-        resources["scripts"] = [f.name for f in scripts_dir.iterdir() if f.is_file()]
+    # A directory's mtime changes whenever an entry is added, removed or
+    # renamed. While the skill directory's mtime holds, the set of resource
+    # subdirectories is unchanged, so only those need a stat to revalidate.
+    cached = _resources_cache.get(key)
+    if cached and cached[0] == skill_mtime:
+        try:
+            if all(os.stat(path).st_mtime_ns == mtime for path, mtime in cached[1]):
+                return cached[2]
+        except OSError:
+            pass
     
-    references_dir = skill_path / "references"
-    if references_dir.exists():
-        resources["references"] = [f.name for f in references_dir.iterdir() if f.is_file()]
+    # One scan of the skill directory finds whichever subdirectories exist
+    resources = {name: [] for name in _RESOURCE_DIRS}
+    with os.scandir(key) as entries:
+        found = [e for e in entries if e.name in resources and e.is_dir()]
     
-    assets_dir = skill_path / "assets"
-    if assets_dir.exists():
-        resources["assets"] = [f.name for f in assets_dir.iterdir() if f.is_file()]
+    subdir_mtimes = []
+    for entry in found:
+        # The subdirectory may vanish between the two scans
+        try:
+            mtime = entry.stat().st_mtime_ns
+            with os.scandir(entry.path) as sub_entries:
+                resources[entry.name] = [e.name for e in sub_entries if e.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        subdir_mtimes.append((entry.path, mtime))
     
+    _resources_cache[key] = (skill_mtime, tuple(subdir_mtimes), resources)
     return resources
 
 
+def _skill_package(skill_name: str, scripts_dir: Path) -> str:
+    """Register the synthetic package for a skill's scripts and return its name."""
+    if _SKILLS_PACKAGE not in sys.modules:
+        root = ModuleType(_SKILLS_PACKAGE)
+        root.__path__ = []
+        sys.modules[_SKILLS_PACKAGE] = root
+    
+    name = f"{_SKILLS_PACKAGE}.{skill_name}"
+    if name not in sys.modules:
+        package = ModuleType(name)
+        package.__path__ = [str(scripts_dir)]
+        sys.modules[name] = package
+    return name
+
+
+def load_skill_script(script_path: Path) -> ModuleType:
+    """
+    Import a skill script as a module, reusing it until the file changes.
+    
+    Args:
+        script_path: Path to the script file
+    
+    Returns:
+        The loaded module
+    """
+    key = str(script_path)
+    mtime = script_path.stat().st_mtime_ns
+    
+    cached = _MODULE_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    # Same-named scripts in different skills get distinct module names, and
+    # relative imports of sibling helpers resolve in the skill's scripts dir
+    package = _skill_package(script_path.parent.parent.name, script_path.parent)
+    module_name = f"{package}.{script_path.stem}"
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    
+    _MODULE_CACHE[key] = (mtime, module)
+    return module
+
+
+class _ThreadStdout:
+    """
+    Stand-in for sys.stdout that sends writes from script threads to a
+    per-thread buffer and everything else to the original stream.
+    
+    redirect_stdout swaps sys.stdout for the whole process, so concurrent
+    scripts would restore each other's streams; routing by thread doesn't.
+    Not an io.TextIOBase subclass, so that attributes such as encoding and
+    fileno() come from the target stream rather than the base class.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def _target(self):
+        buffer = getattr(self._local, "buffer", None)
+        return self._stream if buffer is None else buffer
+    
+    def write(self, s):
+        return self._target().write(s)
+    
+    def flush(self):
+        return self._target().flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+    
+    def call(self, func, *args):
+        """Call func with this thread's writes captured and discarded."""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(*args)
+        finally:
+            self._local.buffer = None
+
+
+def _script_stdout() -> _ThreadStdout:
+    """Install the thread-routing stdout on first use."""
+    if not isinstance(sys.stdout, _ThreadStdout):
+        sys.stdout = _ThreadStdout(sys.stdout)
+    return sys.stdout
+
+
+async def run_script_inprocess(script_path: Path, params: dict) -> dict:
+    """
+    Call a script's run(params) function in the server process.
+    
+    Args:
+        script_path: Path to the script file
+        params: Parameters to pass to the script
+    
+    Returns:
+        dict: Script execution result with status and output
+    """
+    # Scripts share the server's stdout, which carries the MCP protocol; the
+    # import is captured too, since top-level code can print
+    stdout = _script_stdout()
+    loop = asyncio.get_running_loop()
+    
+    # sys.exit() in a script must not take the server down with it
+    try:
+        module = await loop.run_in_executor(_INPROCESS_POOL, stdout.call, load_skill_script, script_path)
+    except (Exception, SystemExit):
+        return {
+            "status": "error",
+            "message": "Failed to load script",
+            "stderr": traceback.format_exc()
+        }
+    
+    if not callable(getattr(module, "run", None)):
+        return {
+            "status": "error",
+            "message": "Script does not define a run(params) function"
+        }
+    
+    try:
+        output = await asyncio.wait_for(
+            loop.run_in_executor(_INPROCESS_POOL, stdout.call, module.run, params),
+            timeout=SCRIPT_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        # The worker thread cannot be killed; it finishes in the background
+        return {
+            "status": "error",
+            "message": f"Script execution timed out ({SCRIPT_TIMEOUT}s limit)"
+        }
+    except (Exception, SystemExit):
+        return {
+            "status": "error",
+            "message": "Script execution failed",
+            "stderr": traceback.format_exc()
+        }
+    
+    return {
+        "status": "success",
+        "result": output if output is not None else {}
+    }
+
+
+def _init_script_worker() -> None:
+    """Detach a worker's stdout from the server's, which carries the MCP protocol."""
+    # Replacing fd 1 also covers child processes and C-level writes, which
+    # redirecting sys.stdout alone would miss
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    sys.stdout = open(os.devnull, "w")
+
+
+def _get_worker_pool() -> ProcessPoolExecutor:
+    """Create the script worker pool on first use."""
+    global _WORKER_POOL
+    if _WORKER_POOL is None:
+        # spawn rather than fork: the server has live event loop and IO threads
+        _WORKER_POOL = ProcessPoolExecutor(
+            max_workers=SCRIPT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_script_worker
+        )
+    return _WORKER_POOL
+
+
+def _discard_worker_pool(pool: ProcessPoolExecutor, kill: bool = False) -> None:
+    """Stop using a worker pool so the next call starts a fresh one."""
+    global _WORKER_POOL
+    if _WORKER_POOL is pool:
+        _WORKER_POOL = None
+    if kill:
+        # ProcessPoolExecutor has no public way to stop a running task
+        for process in list((pool._processes or {}).values()):
+            process.kill()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_script_in_worker(script_path: str, params: dict, cwd: str) -> dict:
+    """Entry point executed inside a worker process for one script call."""
+    os.chdir(cwd)
+    try:
+        module = load_skill_script(Path(script_path))
+        if not callable(getattr(module, "run", None)):
+            return {
+                "status": "error",
+                "message": "Script does not define a run(params) function"
+            }
+        output = module.run(params)
+    except (Exception, SystemExit):
+        # The pool would send SystemExit back and re-raise it in the server
+        return {
+            "status": "error",
+            "message": "Script execution failed",
+            "stderr": traceback.format_exc()
+        }
+    
+    return {
+        "status": "success",
+        "result": output if output is not None else {}
+    }
+
+
+async def run_script_in_worker_pool(script_path: Path, skill_path: Path, params: dict) -> dict:
+    """
+    Call a script's run(params) function in a warm worker process.
+    
+    Args:
+        script_path: Path to the script file
+        skill_path: Path to the skill directory (used as working directory)
+        params: Parameters to pass to the script
+    
+    Returns:
+        dict: Script execution result with status and output
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_worker_pool()
+    try:
+        future = loop.run_in_executor(
+            pool,
+            _run_script_in_worker,
+            str(script_path),
+            params,
+            str(skill_path)
+        )
+    except BrokenProcessPool:
+        # A worker died while idle; replace the pool and run this call in a
+        # one-off subprocess instead
+        _discard_worker_pool(pool)
+        return await run_script_subprocess(script_path, skill_path, params)
+    
+    try:
+        return await asyncio.wait_for(future, timeout=SCRIPT_TIMEOUT)
+    except asyncio.TimeoutError:
+        # The worker is still running the script; kill the pool so it doesn't
+        # hold a slot forever. Calls in flight on the same pool fail with it.
+        _discard_worker_pool(pool, kill=True)
+        return {
+            "status": "error",
+            "message": f"Script execution timed out ({SCRIPT_TIMEOUT}s limit)"
+        }
+    except BrokenProcessPool:
+        # The script crashed its worker, or the pool was killed after another
+        # call timed out; the script may have partially run, so don't retry
+        _discard_worker_pool(pool)
+        return {
+            "status": "error",
+            "message": "Script worker process terminated abruptly"
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Script execution error: {str(e)}"
+        }
+
+
+async def _read_capped(proc: asyncio.subprocess.Process, stream: asyncio.StreamReader) -> Optional[bytes]:
+    """Read a child's output stream to EOF, or kill the child and return None past the cap."""
+    chunks = []
+    size = 0
+    while chunk := await stream.read(65536):
+        size += len(chunk)
+        if size > MAX_SCRIPT_OUTPUT_BYTES:
+            proc.kill()
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _communicate_capped(proc: asyncio.subprocess.Process) -> list[Optional[bytes]]:
+    """Read a child's stdout and stderr concurrently, each subject to the cap."""
+    return await asyncio.gather(
+        _read_capped(proc, proc.stdout),
+        _read_capped(proc, proc.stderr)
+    )
+
+
+async def run_script_subprocess(script_path: Path, skill_path: Path, params: dict) -> dict:
+    """
+    Run a script in a fresh Python subprocess.
+    
+    Args:
+        script_path: Path to the script file
+        skill_path: Path to the skill directory (used as working directory)
+        params: Parameters to pass to the script
+    
+    Returns:
+        dict: Script execution result with status and output
+    """
+    # Compact separators keep the command-line argument small
+    params_json = json.dumps(params, separators=(",", ":")) if params else _EMPTY_PARAMS_JSON
+    
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, str(script_path), params_json,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(skill_path)
+        )
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                _communicate_capped(proc),
+                timeout=SCRIPT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return {
+                "status": "error",
+                "message": f"Script execution timed out ({SCRIPT_TIMEOUT}s limit)"
+            }
+        except asyncio.CancelledError:
+            # Don't leave the child running when the tool call is cancelled
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+            raise
+        await proc.wait()
+        
+        if stdout_bytes is None or stderr_bytes is None:
+            return {
+                "status": "error",
+                "message": f"Script output exceeded the {MAX_SCRIPT_OUTPUT_BYTES} byte limit"
+            }
+        
+        stdout = stdout_bytes.decode("utf-8", errors="replace")
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
+        
+        # Parse output
+        if proc.returncode == 0:
+            try:
+                output = json.loads(stdout) if stdout.strip() else {}
+                return {
+                    "status": "success",
+                    "result": output
+                }
+            except json.JSONDecodeError:
+                return {
+                    "status": "success",
+                    "result": {
+                        "output": stdout.strip()
+                    }
+                }
+        else:
+            return {
+                "status": "error",
+                "message": "Script execution failed",
+                "stderr": stderr,
+                "stdout": stdout,
+                "return_code": proc.returncode
+            }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Script execution error: {str(e)}"
+        }
+
+
+def _skill_metadata(dir_name: str, frontmatter: dict) -> dict:
+    """Build the listing entry for a skill from its frontmatter."""
+    return {
+        "name": frontmatter.get("name", dir_name),
+        "description": frontmatter.get("description", "No description provided")
+    }
+
+
+def _read_skill_metadata(dir_name: str, skill_md: str) -> Optional[dict]:
+    """Read name and description for one skill, or None if it has no readable SKILL.md."""
+    try:
+        return _skill_metadata(dir_name, load_skill_frontmatter(skill_md))
+    except Exception:
+        # Skip skills that can't be read or whose frontmatter isn't a mapping
+        return None
+
+
+def _build_skills_manifest(skills_dir: str, dir_names: list[str]) -> dict[str, list[int]]:
+    """Stat every SKILL.md and map its path to [mtime_ns, size]."""
+    manifest = {}
+    for name in dir_names:
+        skill_md = os.path.join(skills_dir, name, "SKILL.md")
+        try:
+            st = os.stat(skill_md)
+        except OSError:
+            continue
+        manifest[skill_md] = [st.st_mtime_ns, st.st_size]
+    return manifest
+
+
+def _load_skills_snapshot(skills_dir: str) -> Optional[tuple[dict, list[dict]]]:
+    """Load the persisted skill listing, or None if it is missing or unreadable."""
+    try:
+        with open(os.path.join(skills_dir, SKILLS_SNAPSHOT_FILE)) as f:
+            data = json.load(f)
+        if data["version"] != SKILLS_SNAPSHOT_VERSION:
+            return None
+        return data["manifest"], data["skills"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_skills_snapshot(skills_dir: str, manifest: dict, skills: list[dict]) -> None:
+    """Persist the skill listing atomically; failures (e.g. read-only dir) are ignored."""
+    path = os.path.join(skills_dir, SKILLS_SNAPSHOT_FILE)
+    # A unique temp file per write, since listings can run concurrently
+    try:
+        fd, tmp = tempfile.mkstemp(dir=skills_dir, prefix=SKILLS_SNAPSHOT_FILE, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "version": SKILLS_SNAPSHOT_VERSION,
+                "manifest": manifest,
+                "skills": skills
+            }, f, default=str)
+        # mkstemp creates the file owner-only; keep the snapshot world-readable
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+
+
 def get_all_skills_metadata() -> list[dict]:
     """
     Get metadata (name and description) for all available skills.
@@ -130,36 +948,74 @@ def get_all_skills_metadata() -> list[dict]:
     Returns:
         List of dicts with name and description for each skill
     """
+    global _skills_snapshot
+    
     skills = []
-    skills_path = Path(SKILLS_DIR)
+    # Normalized once so cache keys match the Path-built ones used by skill()
+    skills_dir = str(Path(SKILLS_DIR))
     
-    if not skills_path.exists():
+    # Plain strings and DirEntry.is_dir() (which uses the cached d_type)
+    # avoid building a Path object and issuing a stat for every entry
+    try:
+        with os.scandir(skills_dir) as entries:
+            dir_names = sorted(e.name for e in entries if e.is_dir())
+    except FileNotFoundError:
         return skills
     
-    for skill_dir in sorted(skills_path.iterdir()):
-        if not skill_dir.is_dir():
-            continue
-        
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
-            continue
-        
-        try:
-            content = skill_md.read_text()
-            frontmatter, _ = parse_skill_frontmatter(content)
-            
-            name = frontmatter.get("name", skill_dir.name)
-            description = frontmatter.get("description", "No description provided")
-            
-            skills.append({
-                "name": name,
-                "description": description
-            })
-        except Exception:
-            # Skip skills that can't be read
-            continue
+    manifest = _build_skills_manifest(skills_dir, dir_names)
+    
+    snapshot = _skills_snapshot or _load_skills_snapshot(skills_dir)
+    if snapshot and snapshot[0] == manifest:
+        _skills_snapshot = snapshot
+        return list(snapshot[1])
+    
+    # Skills whose cached frontmatter still matches the manifest are served
+    # inline; only the misses are worth handing to the pool
+    results = {}
+    misses = []
+    for skill_md, (mtime_ns, size) in manifest.items():
+        cached = _frontmatter_cache_get(skill_md)
+        # Non-mapping frontmatter goes down the miss path, which skips it
+        if (cached and cached[0] == mtime_ns and cached[1] == size
+                and isinstance(cached[2], dict)):
+            results[skill_md] = _skill_metadata(os.path.basename(os.path.dirname(skill_md)), cached[2])
+        else:
+            misses.append(skill_md)
+    
+    # Read the remaining SKILL.md files concurrently so that on slow or cold
+    # storage the reads overlap instead of running back to back
+    miss_dirs = [os.path.basename(os.path.dirname(p)) for p in misses]
+    results.update(zip(misses, _SKILLS_IO_POOL.map(_read_skill_metadata, miss_dirs, misses)))
+    
+    for skill_md in manifest:
+        metadata = results[skill_md]
+        if metadata is not None:
+            skills.append(metadata)
+    
+    _skills_snapshot = (manifest, skills)
+    _write_skills_snapshot(skills_dir, manifest, skills)
+    return list(skills)
+
+
+# Static parts of the skill tool description; only the skill list is dynamic
+_SKILL_TOOL_HEADER = """Load a skill's full instructions and available resources.
+
+This tool provides access to specialized skills that extend agent capabilities.
+Each skill contains instructions, and optionally scripts, references, and assets.
+
+"""
+
+_SKILL_TOOL_FOOTER = """After loading a skill, use `execute_skill_script()` to run any scripts,
+or `get_skill_resource()` to load additional reference documents."""
+
+_SKILL_TOOL_ARGS = """
     
-    return skills
+    Args:
+        name: The skill name to load (e.g., "hello-world", "slack-message")
+    
+    Returns:
+        dict: Skill metadata, full instructions, and available resources
+    """
 
 
 def build_skill_tool_description() -> str:
@@ -171,29 +1027,23 @@ def build_skill_tool_description() -> str:
     """
     skills = get_all_skills_metadata()
     
-    base_description = """Load a skill's full instructions and available resources.
-
-This tool provides access to specialized skills that extend agent capabilities.
-Each skill contains instructions, and optionally scripts, references, and assets.
-
-"""
+    parts = [_SKILL_TOOL_HEADER]
     
     if skills:
-        base_description += "**Available skills:**\n"
+        parts.append("**Available skills:**\n")
         for skill in skills:
             # Truncate description if too long for the tool description
             desc = skill["description"]
             if len(desc) > 150:
                 desc = desc[:147] + "..."
-            base_description += f"- **{skill['name']}**: {desc}\n"
-        base_description += "\n"
+            parts.append(f"- **{skill['name']}**: {desc}\n")
+        parts.append("\n")
     else:
-        base_description += "**No skills currently available.**\n\n"
+        parts.append("**No skills currently available.**\n\n")
     
-    base_description += """After loading a skill, use `execute_skill_script()` to run any scripts,
-or `get_skill_resource()` to load additional reference documents."""
+    parts.append(_SKILL_TOOL_FOOTER)
     
-    return base_description
+    return "".join(parts)
 
 
 # Initialize the MCP server
@@ -201,7 +1051,7 @@ mcp = FastMCP("skills-mcp")
 
 
 @mcp.tool()
-def skill(name: str) -> dict:
+async def skill(name: str) -> dict:
     """
     Load a skill's full instructions and available resources.
 
@@ -232,9 +1082,12 @@ def skill(name: str) -> dict:
         skill_path = get_skill_path(name)
         skill_md = skill_path / "SKILL.md"
         
-        if not skill_path.exists() or not skill_md.exists():
+        # Read and parse SKILL.md; a missing file means the skill doesn't exist
+        try:
+            frontmatter, body = await asyncio.to_thread(load_skill_md, skill_md)
+        except (FileNotFoundError, NotADirectoryError):
             # Return available skills in error message
-            available = get_all_skills_metadata()
+            available = await asyncio.to_thread(get_all_skills_metadata)
             available_names = [s["name"] for s in available]
             return {
                 "status": "error",
@@ -242,16 +1095,14 @@ def skill(name: str) -> dict:
                 "available_skills": available_names
             }
         
-        # Read and parse SKILL.md
-        content = skill_md.read_text()
-        frontmatter, body = parse_skill_frontmatter(content)
+        resources = await asyncio.to_thread(list_skill_resources, skill_path)
         
         result = {
             "status": "success",
             "name": frontmatter.get("name", name),
             "description": frontmatter.get("description", "No description"),
             "instructions": body,
-            "resources": list_skill_resources(skill_path),
+            "resources": resources,
             "metadata": frontmatter.get("metadata", {}),
         }
         
@@ -281,20 +1132,13 @@ def skill(name: str) -> dict:
 # This ensures the tool description always reflects current skills
 def _update_skill_docstring():
     """Update the skill function's docstring with current skills."""
-    skill.__doc__ = build_skill_tool_description() + """
-    
-    Args:
-        name: The skill name to load (e.g., "hello-world", "slack-message")
-    
-    Returns:
-        dict: Skill metadata, full instructions, and available resources
-    """
+    skill.__doc__ = build_skill_tool_description() + _SKILL_TOOL_ARGS
 
 _update_skill_docstring()
 
 
 @mcp.tool()
-def execute_skill_script(
+async def execute_skill_script(
     skill_name: str,
     script_name: str,
     params: dict = None
@@ -346,10 +1190,8 @@ def execute_skill_script(
         
         if not script_path.exists():
             # List available scripts
-            scripts_dir = skill_path / "scripts"
-            available = []
-            if scripts_dir.exists():
-                available = [f.name for f in scripts_dir.iterdir() if f.is_file() and f.suffix == ".py"]
+            resources = await asyncio.to_thread(list_skill_resources, skill_path)
+            available = [f for f in resources["scripts"] if f.endswith(".py")]
             
             return {
                 "status": "error",
@@ -359,51 +1201,16 @@ def execute_skill_script(
         
         # Prepare parameters
         params = params or {}
-        params_json = json.dumps(params)
         
-        # Execute the script
-        try:
-            result = subprocess.run(
-                [sys.executable, str(script_path), params_json],
-                capture_output=True,
-                text=True,
-                timeout=60,  # 60 second timeout
-                cwd=str(skill_path)
-            )
+        # Bound how many scripts run at once, however they are executed
+        async with _SCRIPT_SEMAPHORE:
+            if INPROCESS_EXECUTION:
+                return await run_script_inprocess(script_path, params)
             
-            # Parse output
-            if result.returncode == 0:
-                try:
-                    output = json.loads(result.stdout.strip()) if result.stdout.strip() else {}
-                    return {
-                        "status": "success",
-                        "result": output
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        "status": "success",
-                        "result": {
-                            "output": result.stdout.strip()
-                        }
-                    }
-            else:
-                return {
-                    "status": "error",
-                    "message": "Script execution failed",
-                    "stderr": result.stderr,
-                    "stdout": result.stdout,
-                    "return_code": result.returncode
-                }
-        except subprocess.TimeoutExpired:
-            return {
-                "status": "error",
-                "message": "Script execution timed out (60s limit)"
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"Script execution error: {str(e)}"
-            }
+            if SCRIPT_WORKERS > 0:
+                return await run_script_in_worker_pool(script_path, skill_path, params)
+            
+            return await run_script_subprocess(script_path, skill_path, params)
     except Exception as e:
         return {
             "status": "error",
@@ -412,7 +1219,7 @@ def execute_skill_script(
 
 
 @mcp.tool()
-def get_skill_resource(skill_name: str, resource_path: str) -> dict:
+async def get_skill_resource(skill_name: str, resource_path: str) -> dict:
     """
     Load a specific resource file from a skill (reference docs, assets, etc.).
     
@@ -451,47 +1258,44 @@ def get_skill_resource(skill_name: str, resource_path: str) -> dict:
         
         # Sanitize and validate resource path (prevent directory traversal)
         resource_path = resource_path.lstrip("/")
-        if ".." in resource_path:
-            return {
-                "status": "error",
-                "message": "Invalid resource path"
-            }
-        
-        # Only allow access to specific directories
-        allowed_prefixes = ["references/", "assets/", "scripts/"]
-        if not any(resource_path.startswith(prefix) for prefix in allowed_prefixes):
+        if not _RESOURCE_PATH_RE.fullmatch(resource_path):
+            # Only allow access to specific directories
+            if ".." in resource_path or resource_path.startswith(_ALLOWED_RESOURCE_PREFIXES):
+                return {
+                    "status": "error",
+                    "message": "Invalid resource path"
+                }
             return {
                 "status": "error",
-                "message": f"Resource path must start with one of: {', '.join(allowed_prefixes)}"
+                "message": f"Resource path must start with one of: {', '.join(_ALLOWED_RESOURCE_PREFIXES)}"
             }
         
         full_path = skill_path / resource_path
         
-        if not full_path.exists():
+        # Read the file in one go; the open reports missing paths and the
+        # fstat behind it non-regular files, so no separate exists/is_file
+        # calls are needed
+        try:
+            data = await asyncio.to_thread(_read_bytes, full_path)
+        except (FileNotFoundError, NotADirectoryError):
             # List available resources
-            resources = list_skill_resources(skill_path)
+            resources = await asyncio.to_thread(list_skill_resources, skill_path)
             return {
                 "status": "error",
                 "message": f"Resource '{resource_path}' not found",
                 "available_resources": resources
             }
+        except IsADirectoryError:
+            data = None
         
-        if not full_path.is_file():
+        if data is None:
             return {
                 "status": "error",
                 "message": "Path is not a file"
             }
         
-        # Read the file
         try:
-            content = full_path.read_text()
-            return {
-                "status": "success",
-                "path": resource_path,
-                "filename": full_path.name,
-                "content": content,
-                "size_bytes": len(content.encode('utf-8'))
-            }
+            content = data.decode("utf-8")
         except UnicodeDecodeError:
             # Binary file - return metadata only
             return {
@@ -499,9 +1303,24 @@ def get_skill_resource(skill_name: str, resource_path: str) -> dict:
                 "path": resource_path,
                 "filename": full_path.name,
                 "content": "[Binary file - cannot display as text]",
-                "size_bytes": full_path.stat().st_size,
+                "size_bytes": len(data),
                 "is_binary": True
             }
+        
+        # Match the newline translation of a text-mode read, and report the
+        # size of the translated text as before
+        size_bytes = len(data)
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+            size_bytes = len(content.encode("utf-8"))
+        
+        return {
+            "status": "success",
+            "path": resource_path,
+            "filename": full_path.name,
+            "content": content,
+            "size_bytes": size_bytes
+        }
     except Exception as e:
         return {
             "status": "error",
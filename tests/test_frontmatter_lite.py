@@ -0,0 +1,79 @@
+"""Tests for the YAML-free SKILL.md frontmatter parser."""
+
+import pytest
+import yaml
+
+from src.server import parse_skill_frontmatter_lite
+
+
+def _yaml_fields(block: str):
+    """name/description as yaml.safe_load reads them, or None if it fails."""
+    try:
+        data = yaml.safe_load(block) or {}
+    except (yaml.YAMLError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return {key: data[key] for key in ("name", "description") if key in data}
+
+
+# Frontmatter blocks the lite parser must read exactly as YAML does
+SIMPLE_BLOCKS = [
+    "name: hello-world\ndescription: Says hello",
+    "name: 'quoted'\ndescription: \"double quoted\"",
+    "# comment\nname: x\n\ndescription: y\n",
+    "name: x\r\ndescription: y\r\n",
+    "name: x\nlicense: MIT\nmetadata:\n  author: someone\n  version: \"1.0\"\n  tags:",
+    "name: x\nversion: 12:30\nother: .inf",
+    "description: only a description",
+    "",
+]
+
+# Blocks YAML reads differently from a line-by-line scan, or rejects
+TRICKY_BLOCKS = [
+    "license: \"MIT\nname: fake\"\ndescription: d",
+    "metadata: {a: 1,\nname: fake}\ndescription: d",
+    "? name\n: c\ndescription: d",
+    "name: x\n...\ndescription: d",
+    "name: x\nlicense: [MIT\ndescription: d",
+    "name: x\nwhen: 2024-13-45\ndescription: d",
+    "name: x\nother: =",
+    "name: x\n\n  continued\ndescription: d",
+    "name: x\n# comment\n  continued",
+    "name:foo\ndescription: d",
+    "name:\tx\ndescription: d",
+    "\tname: x",
+    "name: x\nname: y",
+    "\"name\": x",
+    "name: yes",
+    "name: 123",
+    "name: x # comment",
+    "<<: {name: x}",
+    "metadata:\n  a: 1\n    b: 2",
+    "metadata:\n    a: 1\n  b: 2",
+    "metadata:\n  a:\n    b: 2",
+    "name: x\n  b: 2",
+]
+
+
+@pytest.mark.parametrize("block", SIMPLE_BLOCKS)
+def test_simple_frontmatter_matches_yaml(block):
+    lite = parse_skill_frontmatter_lite(f"---\n{block}\n---\nbody")
+    assert lite is not None
+    assert lite == _yaml_fields(block)
+
+
+@pytest.mark.parametrize("block", TRICKY_BLOCKS)
+def test_tricky_frontmatter_never_disagrees_with_yaml(block):
+    lite = parse_skill_frontmatter_lite(f"---\n{block}\n---\nbody")
+    assert lite is None or lite == _yaml_fields(block)
+
+
+@pytest.mark.parametrize("block", TRICKY_BLOCKS[:10])
+def test_reviewed_cases_fall_back_to_yaml(block):
+    assert parse_skill_frontmatter_lite(f"---\n{block}\n---\nbody") is None
+
+
+def test_missing_frontmatter():
+    assert parse_skill_frontmatter_lite("no frontmatter") is None
+    assert parse_skill_frontmatter_lite("---\nname: x\n") is None